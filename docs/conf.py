@@ -64,4 +64,5 @@ html_sidebars = {
 autoclass_content = "both"
 autodoc_member_order = "bysource"
 autodoc_inherit_docstrings = False
+autodoc_preserve_defaults = True
 intersphinx_mapping = {"python": ("https://docs.python.org/3", None)}
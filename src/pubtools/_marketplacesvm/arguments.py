@@ -139,7 +139,7 @@ class SplitAndExtend(Action):
 
     def __init__(self, *args, **kwargs):
         """Instantiate the SplitAndExtend action."""
-        self.__split_on = kwargs.pop("split_on", ",")
+        self._split_on = kwargs.pop("split_on", ",")
         super(SplitAndExtend, self).__init__(*args, **kwargs)
 
     def __call__(self, _, namespace, values, options=None):
@@ -151,14 +151,14 @@ class SplitAndExtend(Action):
         # so unless this action is being used in conjunction with
         # parser.add_argument(type=<some non-string type>) this
         # should not be the case.
-        split = values.split(self.split_on) if isinstance(values, str) else values
+        split = values.split(self._split_on) if isinstance(values, str) else values
         items.extend(split)
         setattr(namespace, self.dest, items)
 
     @property
     def split_on(self):
         """Return the split delimiter."""
-        return self.__split_on
+        return self._split_on
 
 
 class RepoQueryLoad(Action):
@@ -1,4 +1,28 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
-from .aws import AWSCredentials, AWSProvider  # noqa: F401
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import CloudCredentials, CloudProvider, MarketplaceAuth, get_provider  # noqa: F401
-from .ms_azure import AzureCredentials, AzureProvider  # noqa: F401
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .aws import AWSCredentials, AWSProvider  # noqa: F401
+    from .ms_azure import AzureCredentials, AzureProvider  # noqa: F401
+
+# The cloud specific providers are only imported when accessed to avoid
+# loading all the cloud SDKs when just one of them is required.
+_LAZY_IMPORTS = {
+    "AWSCredentials": ".aws",
+    "AWSProvider": ".aws",
+    "AzureCredentials": ".ms_azure",
+    "AzureProvider": ".ms_azure",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested cloud provider symbol on its first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if not module:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,8 +5,8 @@ from datetime import datetime
 from functools import partial
 from typing import Any, Dict, List, Optional, Tuple
 
-from attrs import asdict, evolve, field, frozen
-from attrs.validators import deep_iterable, instance_of
+from attrs import asdict, evolve, field, fields, frozen
+from attrs.validators import instance_of
 from cloudimg.aws import AWSDeleteMetadata as AWSDeleteMetadata
 from cloudimg.aws import AWSPublishingMetadata as AWSUploadMetadata
 from cloudimg.aws import AWSService as AWSUploadService
@@ -15,13 +15,23 @@ from cloudpub.aws import AWSVersionMetadata as AWSPublishMetadata
 from cloudpub.models.aws import VersionMapping as AWSVersionMapping
 from pushsource import AmiPushItem
 
-from .base import UPLOAD_CONTAINER_NAME, CloudCredentials, CloudProvider, register_provider
+from .base import UPLOAD_CONTAINER_NAME, CloudCredentials, CloudProvider
 
 LOG = logging.getLogger("pubtools.marketplacesvm")
 UploadResult = namedtuple("UploadResult", "id")  # NOSONAR
 DeletedImage = namedtuple("DeletedImage", ["image_id", "snapshot_id"])
 
 
+def _format_version(version: str, format_template: str = "{major}.{minor}") -> str:
+    """Format the given dotted version string using the ``{major}.{minor}.{patch}`` template."""
+    version_split = version.split(".")
+    variables = ["major", "minor", "patch"]
+    format_args = {"version": version}
+    for v in range(len(version_split)):
+        format_args[variables[v]] = version_split[v]
+    return format_template.format(**format_args)
+
+
 def name_from_push_item(
     push_item: AmiPushItem, ami_version_template: Optional[str] = "{major}.{minor}"
 ) -> str:
@@ -37,41 +47,30 @@ def name_from_push_item(
         str: The image name from push item.
     """
 
-    def format_version(version: str, format_template: str = "{major}.{minor}") -> str:
-        version_split = version.split(".")
-        variables = ["major", "minor", "patch"]
-        format_args = {"version": version}
-        for v in range(len(version_split)):
-            format_args[variables[v]] = version_split[v]
-        return format_template.format(**format_args)
-
     parts = []
     release = push_item.release
 
     if release.base_product is not None:
         parts.append(release.base_product)
         if release.base_version is not None:
-            parts.append(format_version(release.base_version))
+            parts.append(_format_version(release.base_version))
 
     parts.append(release.product)
 
     # Some attributes should be separated by underscores
-    underscore_parts = []
+    underscore_part = push_item.virtualization.upper()
 
     if release.version is not None:
-        if ami_version_template:
-            underscore_parts.append(format_version(release.version, ami_version_template))
-        else:
-            underscore_parts.append(format_version(release.version))
-
-    underscore_parts.append(push_item.virtualization.upper())
+        version = _format_version(release.version, ami_version_template or "{major}.{minor}")
+        underscore_part = f"{version}_{underscore_part}"
 
     if release.type is not None:
-        underscore_parts.append(release.type.upper())
+        underscore_part = f"{underscore_part}_{release.type.upper()}"
 
-    parts.append("_".join(underscore_parts))
+    parts.append(underscore_part)
 
-    parts.append(release.date.strftime("%Y%m%d"))
+    date = release.date
+    parts.append(f"{date.year:04d}{date.month:02d}{date.day:02d}")
     parts.append(release.arch)
     parts.append(str(release.respin))
 
@@ -83,7 +82,17 @@ def name_from_push_item(
     return "-".join(parts)
 
 
-@frozen
+def _str_tuple_converter(value: Any) -> Tuple[str, ...]:
+    """Convert the incoming list of strings into a tuple, rejecting any other type."""
+    if not isinstance(value, (list, tuple)):
+        raise TypeError(f"Expected a list of strings, got {type(value)}: {value}")
+    res = tuple(value)
+    if not all(isinstance(x, str) for x in res):
+        raise TypeError(f"Expected a list of strings, got: {value}")
+    return res
+
+
+@frozen(slots=True, repr=False)
 class AWSCredentials(CloudCredentials):
     """Represent the credentials for AWSProvider."""
 
@@ -112,35 +121,20 @@ class AWSCredentials(CloudCredentials):
     aws_access_role_arn: str = field(alias="AWS_ACCESS_ROLE_ARN", validator=instance_of(str))
     """Access role arn for AWS Marketplace."""
 
-    aws_groups: Optional[List[str]] = field(
-        alias="AWS_GROUPS",
-        validator=deep_iterable(
-            member_validator=instance_of(str),
-            iterable_validator=instance_of(list),
-        ),
-        factory=list,
+    aws_groups: Tuple[str, ...] = field(
+        alias="AWS_GROUPS", converter=_str_tuple_converter, factory=tuple
     )
-    """Groups to share image with. Defaults to empty list."""
-
-    aws_accounts: Optional[List[str]] = field(
-        alias="AWS_ACCOUNTS",
-        validator=deep_iterable(
-            member_validator=instance_of(str),
-            iterable_validator=instance_of(list),
-        ),
-        factory=list,
+    """Groups to share image with. Defaults to empty tuple."""
+
+    aws_accounts: Tuple[str, ...] = field(
+        alias="AWS_ACCOUNTS", converter=_str_tuple_converter, factory=tuple
     )
-    """Accounts to share image with. Defaults to empty list."""
-
-    aws_snapshot_accounts: Optional[List[str]] = field(
-        alias="AWS_SNAPSHOT_ACCOUNTS",
-        validator=deep_iterable(
-            member_validator=instance_of(str),
-            iterable_validator=instance_of(list),
-        ),
-        factory=list,
+    """Accounts to share image with. Defaults to empty tuple."""
+
+    aws_snapshot_accounts: Tuple[str, ...] = field(
+        alias="AWS_SNAPSHOT_ACCOUNTS", converter=_str_tuple_converter, factory=tuple
     )
-    """Snapshot accounts to share to. Defaults to empty list."""
+    """Snapshot accounts to share to. Defaults to empty tuple."""
 
     aws_region: str = field(alias="AWS_REGION", validator=instance_of(str), default="us-east-1")
     """AWS Region. Defaults to 'us-east-1'."""
@@ -155,9 +149,16 @@ class AWSCredentials(CloudCredentials):
     """
 
     @property
-    def credentials(self) -> Dict[str, str]:
+    def credentials(self) -> Dict[str, Any]:
         """Return the credentials as a dictionary."""
-        return {k.upper(): v for k, v in asdict(self).items() if k != "cloud_name"}
+        creds = {}
+        for attribute in fields(AWSCredentials):
+            if attribute.name == "cloud_name":
+                continue
+            value = getattr(self, attribute.name)
+            # The list of accounts are stored as tuples but given as lists
+            creds[attribute.alias] = list(value) if isinstance(value, tuple) else value
+        return creds
 
 
 class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
@@ -179,9 +180,9 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
         """
         self.aws_access_role_arn = credentials.aws_access_role_arn
 
-        self.aws_groups = credentials.aws_groups
-        self.aws_accounts = credentials.aws_accounts
-        self.aws_snapshot_accounts = credentials.aws_snapshot_accounts
+        self.aws_groups = list(credentials.aws_groups)
+        self.aws_accounts = list(credentials.aws_accounts)
+        self.aws_snapshot_accounts = list(credentials.aws_snapshot_accounts)
 
         self.upload_svc_partial = partial(
             AWSUploadService, credentials.aws_image_access_key, credentials.aws_image_secret_access
@@ -222,12 +223,10 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
         Returns:
             List[Dict[str, Any]]: List of security groups.
         """
-        security_groups = []
-        for sg in push_item.security_groups:
-            data = asdict(sg)
-            data["ip_ranges"] = [ip for ip in sg.ip_ranges]
-            security_groups.append(data)
-        return security_groups
+        return [
+            {**asdict(sg, recurse=False), "ip_ranges": list(sg.ip_ranges)}
+            for sg in push_item.security_groups
+        ]
 
     def _format_version_info(self, str_to_format: str, version_str: str) -> str:
         """
@@ -381,36 +380,31 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
         ami_version_template = kwargs.get("ami_version_template", "")
         name = name_from_push_item(push_item, ami_version_template)
         binfo = push_item.build_info
-        default_groups = self.aws_groups or []
-        groups = kwargs.get("groups") or default_groups
-        default_accounts = self.aws_accounts or []
-        accounts = kwargs.get("accounts") or default_accounts
-        default_snapshot_accounts = self.aws_snapshot_accounts or []
-        snapshot_accounts = kwargs.get("snapshot_accounts") or default_snapshot_accounts
+        arch = push_item.release.arch
+        groups = kwargs.get("groups") or self.aws_groups
+        accounts = kwargs.get("accounts") or self.aws_accounts
+        snapshot_accounts = kwargs.get("snapshot_accounts") or self.aws_snapshot_accounts
         container = kwargs.get("container") or self.s3_bucket
         LOG.info("Image name: %s | Sharing groups: %s", name, groups)
         # Update some items in push_item
         region = push_item.region or self.default_region
-        push_item = evolve(push_item, region=region)
-        push_item = evolve(push_item, name=name)
+        push_item = evolve(push_item, region=region, name=name)
 
         tags = {
-            "nvra": f"{binfo.name}-{binfo.version}-{binfo.release}.{push_item.release.arch}",
-            "name": push_item.build_info.name,
+            "nvra": f"{binfo.name}-{binfo.version}-{binfo.release}.{arch}",
+            "name": binfo.name,
             "version": binfo.version,
             "release": binfo.release,
-            "arch": push_item.release.arch,
-            "buildid": str(push_item.build_info.id),
+            "arch": arch,
+            "buildid": str(binfo.id),
         }
         if custom_tags:
-            LOG.debug(f"Setting up custom tags: {custom_tags}")
+            LOG.debug("Setting up custom tags: %s", custom_tags)
             tags.update(custom_tags)
 
         if push_item.src.startswith("ami"):
             tags["version"] = push_item.build.split("-")[2]
-            tags["nvra"] = (
-                f"{binfo.name}-{tags['version']}-{binfo.release}.{push_item.release.arch}"  # noqa: E501
-            )
+            tags["nvra"] = f"{binfo.name}-{tags['version']}-{binfo.release}.{arch}"
 
             result = self._copy_image_from_ami_catalog(push_item, name=name, tags=tags)
             return push_item, result
@@ -421,7 +415,7 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
             "snapshot_name": name,
             "container": container,
             "description": push_item.description,
-            "arch": self.ARCH_ALIASES.get(push_item.release.arch, push_item.release.arch),
+            "arch": self.ARCH_ALIASES.get(arch, arch),
             "virt_type": push_item.virtualization,
             "root_device_name": push_item.root_device,
             "volume_type": push_item.volume,
@@ -499,9 +493,11 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
                 Whether to replace every image in the product with the given one or not.
                 Defaults to ``False``
         """
+        destination = push_item.dest[0]
+
         # Check if this product is locked currently and wait for it to become unlocked
-        LOG.info("Checking for active changesets in: %s", push_item.dest[0])
-        self.publish_svc.wait_active_changesets(push_item.dest[0])
+        LOG.info("Checking for active changesets in: %s", destination)
+        self.publish_svc.wait_active_changesets(destination)
 
         if push_item.release.base_product is not None:
             os_name = push_item.release.base_product
@@ -517,20 +513,16 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
         release_date = release.date.strftime("%Y%m%d")
         respin = str(release.respin)
 
-        version_title = (
-            push_item.marketplace_title or f"{push_item.release.version} {release_date}-{respin}"
-        )
+        version_title = push_item.marketplace_title or f"{release.version} {release_date}-{respin}"
 
-        if self._check_version_exists(version_title, push_item.dest[0]):
+        if self._check_version_exists(version_title, destination):
             LOG.info("Version already exists in AWS: %s", version_title)
             return push_item, {}
 
         version_mapping_kwargs = {
             "Version": {
                 "VersionTitle": version_title,
-                "ReleaseNotes": self._format_version_info(
-                    push_item.release_notes, push_item.release.version
-                ),
+                "ReleaseNotes": self._format_version_info(push_item.release_notes, release.version),
             },
             "DeliveryOptions": [
                 {
@@ -545,7 +537,7 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
                                 "ScanningPort": push_item.scanning_port,
                             },
                             "UsageInstructions": self._format_version_info(
-                                push_item.usage_instructions, push_item.release.version
+                                push_item.usage_instructions, release.version
                             ),
                             "RecommendedInstanceType": push_item.recommended_instance_type,
                             "SecurityGroups": self._get_security_items(push_item),
@@ -562,7 +554,7 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
             "marketplace_entity_type": push_item.marketplace_entity_type,
             "image_path": push_item.image_id,
             "architecture": self.ARCH_ALIASES.get(push_item.release.arch, push_item.release.arch),
-            "destination": push_item.dest[0],
+            "destination": destination,
             "keepdraft": nochannel,
             "overwrite": overwrite,
         }
@@ -626,9 +618,11 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
         restrict_minor = kwargs.get("restrict_minor")
 
         if restrict_version:
+            destination = push_item.dest[0]
+
             # Check if this product is locked currently and wait for it to become unlocked
-            LOG.info("Checking for active changesets in: %s", push_item.dest[0])
-            self.publish_svc.wait_active_changesets(push_item.dest[0])
+            LOG.info("Checking for active changesets in: %s", destination)
+            self.publish_svc.wait_active_changesets(destination)
             LOG.info(
                 "Starting to restrict versions: restrict_major = %s, restrict_minor = %s",
                 restrict_major,
@@ -636,7 +630,7 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
             )
 
             restricted_amis = self.publish_svc.restrict_versions(
-                push_item.dest[0], push_item.marketplace_entity_type, restrict_major, restrict_minor
+                destination, push_item.marketplace_entity_type, restrict_major, restrict_minor
             )
 
             LOG.info("Found AMIs to restrict: %s", restricted_amis)
@@ -668,8 +662,3 @@ class AWSProvider(CloudProvider[AmiPushItem, AWSCredentials]):
         }
         res = self._delete(region, **delete_meta_kwargs)
         return push_item, res
-
-
-register_provider(
-    AWSProvider, "aws-na", "aws-emea", "aws-us-storage", "aws-us-gov-storage", "aws-china-storage"
-)
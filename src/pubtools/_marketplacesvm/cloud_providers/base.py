@@ -3,6 +3,7 @@ import logging
 import os
 import sys
 from abc import ABC, abstractmethod
+from importlib import import_module
 from typing import Any, Dict, Generic, NoReturn, Optional, Tuple, Type, TypeVar
 
 if sys.version_info >= (3, 8):
@@ -20,7 +21,20 @@ T = TypeVar("T", bound=VMIPushItem)
 
 UPLOAD_CONTAINER_NAME = os.getenv("UPLOAD_CONTAINER_NAME", "pubupload")
 
-__CLOUD_PROVIDERS = {}
+# The built-in providers are registered by their import path since their modules pull the
+# cloud SDKs. They're only imported and cached on the first ``get_provider`` call requesting them.
+_AWS_PROVIDER = ".aws:AWSProvider"
+_AZURE_PROVIDER = ".ms_azure:AzureProvider"
+
+__CLOUD_PROVIDERS: Dict[str, Any] = {
+    "aws-na": _AWS_PROVIDER,
+    "aws-emea": _AWS_PROVIDER,
+    "aws-us-storage": _AWS_PROVIDER,
+    "aws-us-gov-storage": _AWS_PROVIDER,
+    "aws-china-storage": _AWS_PROVIDER,
+    "azure-na": _AZURE_PROVIDER,
+    "azure-emea": _AZURE_PROVIDER,
+}
 
 
 class MarketplaceAuth(TypedDict):
@@ -321,6 +335,20 @@ def register_provider(provider: Type[P], *args) -> None:
         __CLOUD_PROVIDERS.update({alias: provider})
 
 
+def _resolve_provider(path: str) -> Any:
+    """
+    Import and return the provider class from its import path.
+
+    Args:
+        path (str)
+            The provider path in the format ``module:ClassName``.
+    Returns:
+        The provider class.
+    """
+    module, _, klass = path.partition(":")
+    return getattr(import_module(module, __package__), klass)
+
+
 def get_provider(auth_data: MarketplaceAuth) -> Any:
     """
     Return the required provider by its marketplace_account name.
@@ -341,6 +369,9 @@ def get_provider(auth_data: MarketplaceAuth) -> Any:
 
     auth.update({"cloud_name": marketplace_account})
     klass = __CLOUD_PROVIDERS.get(marketplace_account)
+    if isinstance(klass, str):
+        klass = _resolve_provider(klass)
+        __CLOUD_PROVIDERS[marketplace_account] = klass
 
     if not klass or not issubclass(klass, CloudProvider):
         message = f"No provider found for {marketplace_account}"
@@ -12,7 +12,7 @@ from cloudpub.ms_azure import AzurePublishingMetadata as AzurePublishMetadata
 from cloudpub.ms_azure import AzureService as AzurePublishService
 from pushsource import VHDPushItem
 
-from .base import UPLOAD_CONTAINER_NAME, CloudCredentials, CloudProvider, register_provider
+from .base import UPLOAD_CONTAINER_NAME, CloudCredentials, CloudProvider
 
 LOG = logging.getLogger("pubtools.marketplacesvm")
 
@@ -211,7 +211,7 @@ class AzureProvider(CloudProvider[VHDPushItem, AzureCredentials]):
             "buildid": str(push_item.build_info.id),
         }
         if custom_tags:
-            LOG.debug(f"Setting up custom tags: {custom_tags}")
+            LOG.debug("Setting up custom tags: %s", custom_tags)
             tags.update(custom_tags)
 
         # For Coreos-Assembler images change the version and nvra tag
@@ -371,7 +371,7 @@ class AzureProvider(CloudProvider[VHDPushItem, AzureCredentials]):
         will have a "draft" state that is caused by the tooling, hence the Borg to keep track of
         what it touched to disconsider this "draft" as a signal of manual changes.
         """
-        offer_name = destination.split("/")[0]
+        offer_name = destination.partition("/")[0]
         product = self.publish_svc.get_product_by_name(offer_name)
 
         # Here we could have the state as: "draft", "preview" or "live"
@@ -388,6 +388,3 @@ class AzureProvider(CloudProvider[VHDPushItem, AzureCredentials]):
                 raise RuntimeError(
                     f"Can't update the offer {offer_name} as it's already being changed."
                 )
-
-
-register_provider(AzureProvider, "azure-na", "azure-emea")
@@ -24,6 +24,9 @@ class CloudService(Service):
         """Instantiate a CloudService object."""
         self._instances: Dict[str, CloudProvider] = {}
         self._creds: Dict[str, MarketplaceAuth] = {}
+        self._creds_loaded = False
+        self._creds_lock = threading.Lock()
+        self._instance_locks: Dict[str, threading.Lock] = {}
         self._lock = threading.Lock()
         super(CloudService, self).__init__(*args, **kwargs)
 
@@ -55,18 +58,24 @@ class CloudService(Service):
         )
 
     def _init_creds(self) -> None:
-        """Load the credentials data to memory whenever required."""
+        """Load the credentials data to memory once, whenever required."""
+        with self._creds_lock:
+            if not self._creds_loaded:
+                self._load_creds()
+                self._creds_loaded = True
+
+    def _load_creds(self) -> None:
+        """Parse all the given credentials into ``self._creds``."""
         # Note: The credentials list can have a filename or a base64 encoded dict
         credentials = self._service_args.credentials
         credentials = credentials.split(',') if credentials else []
         for cred in credentials:
             if os.path.isfile(cred):  # If it's a filename we load it from JSON
-                with open(cred, 'r') as fp:
-                    cred_data = json.load(fp)
+                with open(cred, 'rb') as fp:
+                    cred_data = json.loads(fp.read())
             else:  # we decode it from base64
                 try:
-                    b_data = base64.b64decode(cred.encode("ascii"))
-                    cred_data = json.loads(b_data.decode("ascii"))
+                    cred_data = json.loads(base64.b64decode(cred))
                 except Exception as e:
                     message = "Invalid credentials"
                     log.error(f"{message} : {e}")
@@ -117,7 +126,14 @@ class CloudService(Service):
             account_name (str)
                 The alias of the marketplace to get its account (e.g.: "aws-na").
         """
+        instance = self._instances.get(account_name)
+        if instance is not None:
+            return instance
+
+        # Only lock the requested account so distinct providers can be built in parallel
         with self._lock:
+            account_lock = self._instance_locks.setdefault(account_name, threading.Lock())
+        with account_lock:
             if account_name not in self._instances:
                 creds = self._get_cloud_credentials(account_name)
                 extra_args = self._parse_extra_args()
@@ -10,8 +10,9 @@ import threading
 from argparse import ArgumentParser
 from concurrent.futures import Future
 from datetime import datetime, timezone
-from typing import Any, Dict, Generic, List, NoReturn, Optional, Set, TypeVar
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import Any, Dict, Generic, List, NoReturn, Optional, Set, Tuple, TypeVar
+from urllib.parse import urljoin, urlsplit
 
 import requests
 from more_executors import Executors
@@ -38,6 +39,16 @@ else:
 LOG = logging.getLogger("pubtools.marketplacesvm")
 
 
+@lru_cache(maxsize=256)
+def _rhsm_product_name(product: str, image_type: str) -> str:
+    # The rhsm prodcut should always be the product (short) plus
+    # "_HOURLY" for hourly type images.
+    image_type = image_type.upper()
+    if image_type == "HOURLY":
+        return product + "_" + image_type
+    return product
+
+
 class RHSMClient:
     """Client for RHSM updates."""
 
@@ -88,6 +99,12 @@ class RHSMClient:
     def _get(self, *args, **kwargs) -> requests.Response:
         return self._session.get(*args, **kwargs)
 
+    @property
+    def _env_settings(self) -> Dict[Tuple[Any, ...], Dict[str, Any]]:
+        if not hasattr(self._tls, "env_settings"):
+            self._tls.env_settings = {}
+        return self._tls.env_settings
+
     def _send(self, prepped_req: requests.PreparedRequest, **kwargs) -> requests.Response:
         settings = {
             "url": prepped_req.url,
@@ -98,7 +115,20 @@ class RHSMClient:
         }
         # merging environment settings because prepared request doesn't take them into account
         # details: https://requests.readthedocs.io/en/latest/user/advanced/#prepared-requests
-        merged = self._session.merge_environment_settings(**settings)  # type: ignore [arg-type]
+        #
+        # The merged settings only depend on the URL origin for a given session, so they're
+        # cached per origin unless custom proxies are requested.
+        key = (
+            urlsplit(prepped_req.url or "")[:2],
+            settings["stream"],
+            settings["verify"],
+            settings["cert"],
+        )
+        merged = None if settings["proxies"] else self._env_settings.get(key)
+        if merged is None:
+            merged = self._session.merge_environment_settings(**settings)  # type: ignore [arg-type]
+            if not settings["proxies"]:
+                self._env_settings[key] = merged
         kwargs.update(merged)
         return self._session.send(prepped_req, **kwargs)
 
@@ -275,8 +305,10 @@ class AwsRHSMClientService(Service):
     def __init__(self, *args, **kwargs):
         """Initialize the AwsRHSMClientService."""
         self._lock = threading.Lock()
+        self._products_lock = threading.Lock()
         self._rhsm_instance = None
         self._rhsm_products: Optional[List[Dict[str, Any]]] = None
+        self._rhsm_products_index: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
         self._rhsm_image_ids: Optional[Set[str]] = None
         super(AwsRHSMClientService, self).__init__(*args, **kwargs)
 
@@ -316,19 +348,30 @@ class AwsRHSMClientService(Service):
     @property
     def rhsm_products(self) -> List[Dict[str, Any]]:
         """List of products/image groups for AWS provider."""
-        if self._rhsm_products is None:
-            response = self.rhsm_client.aws_products().result()
-            self._rhsm_products = response.json()["body"]
-            prod_names = [
-                "%s(%s)" % (p["name"], p["providerShortName"]) for p in self._rhsm_products
-            ]
-            LOG.debug(
-                "%s Products(AWS provider) in rhsm: %s",
-                len(prod_names),
-                ", ".join(sorted(prod_names)),
-            )
+        with self._products_lock:
+            if self._rhsm_products is None:
+                response = self.rhsm_client.aws_products().result()
+                products = response.json()["body"]
+                if LOG.isEnabledFor(logging.DEBUG):
+                    prod_names = ["%s(%s)" % (p["name"], p["providerShortName"]) for p in products]
+                    LOG.debug(
+                        "%s Products(AWS provider) in rhsm: %s",
+                        len(prod_names),
+                        ", ".join(sorted(prod_names)),
+                    )
+                self._rhsm_products = products
         return self._rhsm_products
 
+    @property
+    def _rhsm_products_by_name(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Index of ``rhsm_products`` by their name and provider short name."""
+        if self._rhsm_products_index is None:
+            index: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            for p in self.rhsm_products:
+                index.setdefault((p["name"], p["providerShortName"]), p)
+            self._rhsm_products_index = index
+        return self._rhsm_products_index
+
     @property
     def rhsm_image_ids(self) -> Optional[Set[str]]:
         """List of products/image groups for AWS provider."""
@@ -361,22 +404,14 @@ class AwsRHSMClientService(Service):
         Returns:
             The specified product info from RHSM.
         """
-        # The rhsm prodcut should always be the product (short) plus
-        # "_HOURLY" for hourly type images.
-        image_type = image_type.upper()
-        if image_type == "HOURLY":
-            product = product + "_" + image_type
-
+        product = _rhsm_product_name(product, image_type)
         LOG.debug(
             "Searching for product %s for provider %s in rhsm",
             product,
             aws_provider_name,
         )
-        for rhsm_product in self.rhsm_products:
-            if (
-                rhsm_product["name"] == product
-                and rhsm_product["providerShortName"] == aws_provider_name  # noqa: W503
-            ):
-                return rhsm_product
+        rhsm_product = self._rhsm_products_by_name.get((product, aws_provider_name))
+        if rhsm_product is not None:
+            return rhsm_product
 
         raise RuntimeError("Product not in RHSM: %s" % product)
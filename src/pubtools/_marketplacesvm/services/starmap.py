@@ -23,9 +23,11 @@ class StarmapService(Service):
 
     def __init__(self, *args, **kwargs) -> None:
         """Instantiate a StarmapService object."""
-        self._instance = None
+        self._tls = threading.local()
+        self._client_kwargs: Optional[Dict[str, Any]] = None
         self._container = None
         self._lock = threading.Lock()
+        self._name_locks: Dict[str, threading.Lock] = {}
         super(StarmapService, self).__init__(*args, **kwargs)
 
     def add_service_args(self, parser: ArgumentParser) -> None:
@@ -88,15 +90,19 @@ class StarmapService(Service):
 
     @property
     def starmap(self) -> StarmapClient:
-        """Return a StArMap Client instance."""
-        with self._lock:
-            if not self._instance:
-                offline = self._service_args.offline
-                kwargs = self._get_repo()
-                session_klass = StarmapSession if not offline else StarmapMockSession
-                session = session_klass(self._service_args.starmap_url, api_version="v2")
-                self._instance = StarmapClient(session=session, **kwargs)
-        return self._instance
+        """Return a StArMap Client instance for the current thread."""
+        if not hasattr(self._tls, "instance"):
+            with self._lock:
+                # The local mappings provider is shared by the clients of all threads
+                if self._client_kwargs is None:
+                    self._client_kwargs = self._get_repo()
+            # The requests session is not safe to share between threads, thus each thread
+            # querying StArMap gets its own session
+            offline = self._service_args.offline
+            session_klass = StarmapSession if not offline else StarmapMockSession
+            session = session_klass(self._service_args.starmap_url, api_version="v2")
+            self._tls.instance = StarmapClient(session=session, **self._client_kwargs)
+        return self._tls.instance
 
     def _store_container_responses(self, qrc: QueryResponseContainer) -> None:
         for qre in qrc.responses:
@@ -110,11 +116,15 @@ class StarmapService(Service):
         if not isinstance(qrc, QueryResponseContainer):
             raise RuntimeError(f"Unknown response format from StArMap: {type(qrc)}")
 
-        self._container = self._container or qrc
         with self._lock:
+            self._container = self._container or qrc
             self._store_container_responses(qrc)
         return qrc.responses
 
+    def _name_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._name_locks.setdefault(name, threading.Lock())
+
     def query_image_by_name(
         self, name: str, version: Optional[str] = None
     ) -> List[QueryResponseEntity]:
@@ -132,9 +142,11 @@ class StarmapService(Service):
         Returns:
             List[QueryResponseEntity]: The requested data when found or an empty list.
         """
-        if self._container:
-            return self._container.filter_by_name(name) or self._query_server(name, version)
-        return self._query_server(name, version)
+        # Concurrent queries for the same name wait for the first one to fill the cache
+        with self._name_lock(name):
+            if self._container:
+                return self._container.filter_by_name(name) or self._query_server(name, version)
+            return self._query_server(name, version)
 
     @staticmethod
     def filter_for(
@@ -29,6 +29,9 @@ ExtendedPushItem = namedtuple(
 )
 EnrichedPushItem = Dict[str, List[ExtendedPushItem]]
 
+# Products which are expected to be shipped only to hourly destinations
+HOURLY_ONLY_PRODUCTS = frozenset(("RHEL_HA", "SAP"))
+
 
 class UploadParams(TypedDict):
     """Represent the parameters to start the community VM upload operation."""
@@ -45,6 +48,8 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
     """Upload an AMI to S3 and update RHSM."""
 
     _PROCESS_THREADS = int(os.environ.get("COMMUNITY_PUSH_PROCESS_THREADS", "10"))
+    _QUERY_THREADS = int(os.environ.get("COMMUNITY_PUSH_QUERY_THREADS", "5"))
+    _SOURCE_THREADS = int(os.environ.get("COMMUNITY_PUSH_SOURCE_THREADS", "5"))
     _REQUIRE_BC = bool(
         os.environ.get("COMMUNITY_PUSH_REQUIRE_BILLING_CODES", "true").lower() == "true"
     )
@@ -55,27 +60,48 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
         self._rhsm_products: Optional[List[Dict[str, Any]]] = None
         super(CommunityVMPush, self).__init__(*args, **kwargs)
 
+    def _iter_source(self, source_url: str) -> Iterator[AmiPushItem]:
+        """Yield the AmiPushItems from a single source."""
+        with Source.get(source_url) as source:
+            log.info("Loading items from %s", source_url)
+            for item in source:
+                if not isinstance(item, AmiPushItem):
+                    log.warning(
+                        "Push Item %s at %s is not an AmiPushItem, dropping it from the queue.",
+                        item.name,
+                        item.src,
+                    )
+                    continue
+                self.builds_borg.received_builds.add(item.build_info.id)
+                yield item
+
+    def _load_source(self, source_url: str) -> List[AmiPushItem]:
+        """Return all AmiPushItems from a single source."""
+        return list(self._iter_source(source_url))
+
     @property
     def raw_items(self) -> Iterator[AmiPushItem]:
         """
         Load all push items from the given source(s) and yield them.
 
+        The sources are loaded in parallel while the items are yielded in the sources order.
+
         Yields:
             The AmiPushItems from the given sources.
         """
-        for source_url in self.args.source:
-            with Source.get(source_url) as source:
-                log.info("Loading items from %s", source_url)
-                for item in source:
-                    if not isinstance(item, AmiPushItem):
-                        log.warning(
-                            "Push Item %s at %s is not an AmiPushItem, dropping it from the queue.",
-                            item.name,
-                            item.src,
-                        )
-                        continue
-                    self.builds_borg.received_builds.add(item.build_info.id)
-                    yield item
+        sources = self.args.source
+        if len(sources) <= 1:  # No need to spawn threads for a single source
+            for source_url in sources:
+                yield from self._iter_source(source_url)
+            return
+
+        with Executors.thread_pool(
+            name="pubtools-marketplacesvm-community-sources",
+            max_workers=min(len(sources), self._SOURCE_THREADS),
+        ) as executor:
+            loaded = [executor.submit(self._load_source, source_url) for source_url in sources]
+            for f_items in loaded:
+                yield from f_items.result()
 
     @property
     def mapped_items(self) -> List[MappedVMIPushItemV2]:  # type: ignore [override]
@@ -85,8 +111,29 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
         Returns
             The wrapped push item with the additional information from StArMap.
         """
+        with Executors.thread_pool(
+            name="pubtools-marketplacesvm-community-starmap-query",
+            max_workers=self._QUERY_THREADS,
+        ) as executor:
+            # Query StArMap as soon as each item is loaded from the sources, so the
+            # source loading overlaps with the queries, while the responses are still
+            # processed in the items order.
+            queries = [
+                (
+                    item,
+                    executor.submit(
+                        self.query_image_by_name,
+                        name=item.build_info.name,
+                        version=item.build_info.version,
+                    ),
+                )
+                for item in self.raw_items
+            ]
+
         mapped_items = []
-        for item in self.raw_items:
+        # Items from the same build share the same StArMap response, so only convert it once
+        query_dicts: Dict[int, Dict[str, Any]] = {}
+        for item, f_query in queries:
             log.info(
                 "Retrieving the mappings for %s from %s using the community workflow.",
                 item.name,
@@ -94,25 +141,25 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
             )
             binfo = item.build_info
             cloud = CLOUD_NAME_FOR_PI[type(item)]
-            query = self.query_image_by_name(
-                name=binfo.name,
-                version=binfo.version,
-            )
-            query = self.filter_for(query, workflow=Workflow.community, cloud=cloud)
+            query = self.filter_for(f_query.result(), workflow=Workflow.community, cloud=cloud)
             if query:
                 query_returned_from_starmap = query[0]
-                log.info(
-                    "starmap query returned for %s : %s",
-                    item.name,
-                    json.dumps(
-                        {
-                            "name": binfo.name,
-                            "version": binfo.version,
-                            "query_response": asdict(query_returned_from_starmap),
-                        },
-                        default=str,
-                    ),
-                )
+                if log.isEnabledFor(logging.INFO):
+                    query_key = id(query_returned_from_starmap)
+                    if query_key not in query_dicts:
+                        query_dicts[query_key] = asdict(query_returned_from_starmap)
+                    log.info(
+                        "starmap query returned for %s : %s",
+                        item.name,
+                        json.dumps(
+                            {
+                                "name": binfo.name,
+                                "version": binfo.version,
+                                "query_response": query_dicts[query_key],
+                            },
+                            default=str,
+                        ),
+                    )
                 item = MappedVMIPushItemV2(item, query_returned_from_starmap)
                 mapped_items.append(item)
             else:
@@ -159,7 +206,6 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
                     pi.name,
                     pi.src,
                 )
-                pi = evolve(pi, state="INVALIDFILE")
                 verified = False
         return verified
 
@@ -300,6 +346,7 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
             List[EnrichedPushItem]: List of resulting enriched push items.
         """
         result: List[EnrichedPushItem] = []
+        beta = self.args.beta
         for mapped_item in mapped_items:
             account_dict: EnrichedPushItem = {}
             for storage_account, mrobj in mapped_item.starmap_query_entity.mappings.items():
@@ -310,7 +357,7 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
                     log.debug("Mapped push item for %s: %s", storage_account, pi)
                     r = dest.meta.get("release") or {}
                     r_type_str = str(r.get("type", "")).lower()
-                    r_type_str = "beta" if self.args.beta else r_type_str
+                    r_type_str = "beta" if beta else r_type_str
                     if r_type_str:
                         release_type = ReleaseType(r_type_str)
                     else:
@@ -327,7 +374,8 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
                     # SAP and RHEL-HA images are expected to be
                     # shipped only to hourly destinations
                     # See: https://gitlab.cee.redhat.com/exd-guild-distribution/cloud-image-tools/-/blob/master/cloudimgtools/create_staged_pushes.py#L330-348  # noqa: E501
-                    if epi.type != "hourly" and epi.release.product in ("RHEL_HA", "SAP"):
+                    image_type = epi.type
+                    if image_type != "hourly" and epi.release.product in HOURLY_ONLY_PRODUCTS:
                         log.warning(
                             "Skipping upload of '%s' for '%s' as the image is expected to be pushed"
                             " only to hourly destinations",
@@ -340,7 +388,7 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
                         "Adding push item \"%s\" with destination \"%s\" and type \"%s\" to the queue.",  # noqa: E501
                         epi.name,
                         epi.dest[0],
-                        epi.type,
+                        image_type,
                     )
                     ex_pi = ExtendedPushItem(
                         epi,
@@ -451,20 +499,15 @@ class CommunityVMPush(MarketplacesVMPush, AwsRHSMClientService):
         Returns:
             Dictionary with the resulting operation for the Collector service.
         """
-        to_await = []
-        upload_result = []
-        executor = Executors.thread_pool(
+        with Executors.thread_pool(
             name="pubtools-marketplacesvm-community-push",
             max_workers=self._PROCESS_THREADS,
-        )
-
-        # consume the queue
-        for data in push_queue:
-            to_await.append(executor.submit(self._upload, **data))
+        ) as executor:
+            # consume the queue
+            to_await = [executor.submit(self._upload, **data) for data in push_queue]
 
-        # wait for results
-        for f_out in to_await:
-            upload_result.append(f_out.result())
+            # wait for results
+            upload_result = [f_out.result() for f_out in to_await]
 
         # Return the data for collection
         return [
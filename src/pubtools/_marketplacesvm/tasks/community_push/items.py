@@ -1,7 +1,7 @@
 import logging
 import os
 from enum import Enum
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from attrs import evolve
 from pushsource import AmiBillingCodes, AmiPushItem, AmiRelease
@@ -15,6 +15,14 @@ BILLING_CODES_NAME_MAPPING = {
     "marketplace": "Marketplace",
 }
 
+# SAP (resp. SAPHANA) images are expected to be released via Marketplace,
+# so for SAP, not even the hourly images are expected to be released publicly.
+NEVER_PUBLIC_PRODUCTS = frozenset({"SAP"})
+
+# HighAvailability images are expected to be released publicly only during GA.
+# For Beta releases, they are expected to stay shared only with selected QE accounts.
+PRIVATE_RELEASES = frozenset({("RHEL_HA", "beta")})
+
 log = logging.getLogger("pubtools.marketplacesvm")
 
 
@@ -30,9 +38,9 @@ def _get_push_item_region_type(push_item: AmiPushItem, destination: Destination)
     return evolve(push_item, region=region, type=image_type)
 
 
-def _set_push_item_billing_code(
+def _get_billing_codes(
     push_item: AmiPushItem, destination: Destination, billing_config: Optional[BILLING_CONFIG]
-) -> AmiPushItem:
+) -> AmiBillingCodes:
     # The billing code config should be provided by StArMap
     if not billing_config:
         raise RuntimeError(
@@ -43,12 +51,9 @@ def _set_push_item_billing_code(
 
     # Auxiliary functions
     def is_match(bc_conf_item: BillingCodeRule, image_filename: str, image_type: str) -> bool:
-        return all(
-            [
-                image_filename.startswith(bc_conf_item.image_name),
-                image_type in bc_conf_item.image_types,
-            ]
-        )
+        if not image_filename.startswith(bc_conf_item.image_name):
+            return False
+        return image_type in bc_conf_item.image_types
 
     def billing_code_name(bc_conf_item: BillingCodeRule, image_type: str) -> str:
         bc_name = bc_conf_item.name
@@ -60,49 +65,38 @@ def _set_push_item_billing_code(
     out_codes = []
     out_name = None
 
+    base_src = os.path.basename(push_item.src)
+    image_type = push_item.type
     for bc_conf_name, bc_conf_item in billing_config.items():
-        base_src = os.path.basename(push_item.src)
         log.debug(
             "Attempting to match billing rule %s to %s type %s",
             bc_conf_name,
             base_src,
-            push_item.type,
+            image_type,
         )
-        if is_match(bc_conf_item, base_src, push_item.type):
+        if is_match(bc_conf_item, base_src, image_type):
             log.debug("Matched billing rule %s for %s", bc_conf_name, base_src)
             out_codes.extend(bc_conf_item.codes)
             if out_name is None:
-                out_name = billing_code_name(bc_conf_item, push_item.type)
+                out_name = billing_code_name(bc_conf_item, image_type)
     if not out_name:
         raise RuntimeError(f"Could not apply a billing code for {push_item}")
     codes = {"codes": out_codes, "name": out_name}
 
     log.debug("Billing codes for %s: %s (%s)", push_item.name, out_codes, out_name)
-    push_item = evolve(push_item, billing_codes=AmiBillingCodes._from_data(codes))
-    return push_item
+    return AmiBillingCodes._from_data(codes)
 
 
-def _get_push_item_public_image(push_item: AmiPushItem) -> AmiPushItem:
-    def is_public_image(image_type: str, release: AmiRelease) -> bool:
-        if image_type != "hourly":
-            # Only the hourly images should be shared publicly since they are the only
-            # type to charge an additional Red Hat fee.
-            # http://docs.aws.amazon.com/AWSEC2/latest/UserGuide/sharingamis-intro.html
-            return False
-        if release.product == "RHEL_HA" and release.type == "beta":
-            # HighAvailability images are expected to be released publicly only during GA.
-            # For Beta releases, they are expected to stay shared only with selected QE accounts.
-            return False
-        if release.product == "SAP":
-            # SAP (resp. SAPHANA) images are expected to be released via Marketplace,
-            # so for SAP, not even the hourly images are expected to be released publicly.
-            return False
-        return True
-
-    return evolve(push_item, public_image=is_public_image(push_item.type, push_item.release))
+def _is_public_image(image_type: str, release: AmiRelease) -> bool:
+    # Only the hourly images should be shared publicly since they are the only
+    # type to charge an additional Red Hat fee.
+    # http://docs.aws.amazon.com/AWSEC2/latest/UserGuide/sharingamis-intro.html
+    if image_type != "hourly" or release.product in NEVER_PUBLIC_PRODUCTS:
+        return False
+    return (release.product, release.type) not in PRIVATE_RELEASES
 
 
-def _get_push_item_rhsm_provider(push_item: AmiPushItem, destination: Destination) -> AmiPushItem:
+def _get_rhsm_provider(destination: Destination) -> str:
     # The idea here is to write the RHSM "provider" name into the AmiPush item so we won't
     # need to have it passed by command line.
     #
@@ -110,21 +104,14 @@ def _get_push_item_rhsm_provider(push_item: AmiPushItem, destination: Destinatio
     # and it seems like to be cumbersome adding it upstream just for this use case we'll borrow
     # a property used for marketplace but not for community AMIs named `marketplace_entity_type`
     # and use it to hold the RHSM provider name for this workflow.
-    provider_name = destination.provider or "AWS"  # Defaults to "AWS" like the pubtools-ami CMD arg
-    return evolve(push_item, marketplace_entity_type=provider_name)
-
+    return destination.provider or "AWS"  # Defaults to "AWS" like the pubtools-ami CMD arg
 
-def _update_destination(push_item: AmiPushItem, destination: Destination) -> AmiPushItem:
-    return evolve(push_item, dest=[destination.destination])
 
-
-def _fix_arm64_arch(push_item: AmiPushItem) -> AmiPushItem:
+def _get_arch(release: AmiRelease) -> str:
     # RHSM doesn't accept the value `aarch64` so we must rename it to `arm64`
-    release: AmiRelease = push_item.release
     if release.arch.lower() == "aarch64":
-        release = evolve(release, arch="arm64")
-        push_item = evolve(push_item, release=release)
-    return push_item
+        return "arm64"
+    return release.arch
 
 
 def enrich_push_item(
@@ -157,23 +144,22 @@ def enrich_push_item(
     # - type: "hourly" or "access"
     # - billing_codes
     # - public_image
+    #
+    # The region and type are set first as the billing codes are matched against them.
     pi = _get_push_item_region_type(push_item, destination)
+    updates: Dict[str, Any] = {}
     if require_bc:
-        pi = _set_push_item_billing_code(pi, destination, billing_config)
+        updates["billing_codes"] = _get_billing_codes(pi, destination, billing_config)
     else:
         log.warning("BILLING CODES REQUIREMENT IS CURRENTLY DISABLED!")
-    pi = _get_push_item_rhsm_provider(pi, destination)
-    pi = _get_push_item_public_image(pi)
-
-    # Rename aarch64 to arm64 if needed
-    pi = _fix_arm64_arch(pi)
+    updates["marketplace_entity_type"] = _get_rhsm_provider(destination)
+    updates["public_image"] = _is_public_image(pi.type, pi.release)
 
-    # Set the release type
+    # Rename aarch64 to arm64 if needed and set the release type
     r_type = release_type.value if release_type else None
-    rel = evolve(pi.release, type=r_type)
-    pi = evolve(pi, release=rel)
+    updates["release"] = evolve(pi.release, arch=_get_arch(pi.release), type=r_type)
 
     # Now we need to convert the "dest" from "List[Destination]" into "List[str]"
     # by just keeping the desired destinations and getting rid of everything else
-    pi = _update_destination(pi, destination)
-    return pi
+    updates["dest"] = [destination.destination]
+    return evolve(pi, **updates)
@@ -3,7 +3,8 @@ import datetime
 import json
 import logging
 import os
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import threading
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from attrs import asdict, evolve
 from more_executors import Executors
@@ -20,13 +21,26 @@ log = logging.getLogger("pubtools.marketplacesvm")
 UPLOAD_RESULT = Tuple[MappedVMIPushItemV2, QueryResponseEntity]
 
 
+class MappedEntry(NamedTuple):
+    """A mapped push item alongside the StArMap query it was mapped from."""
+
+    item: MappedVMIPushItemV2
+    starmap_query: QueryResponseEntity
+
+
 class MarketplacesVMPush(MarketplacesVMTask, CloudService, CollectorService, StarmapService):
     """Push and publish content to various cloud marketplaces."""
 
-    _REQUEST_THREADS = int(os.environ.get("MARKETPLACESVM_PUSH_REQUEST_THREADS", "5"))
+    _REQUEST_THREADS = int(os.environ.get("MARKETPLACESVM_PUSH_REQUEST_THREADS", "10"))
     _PROCESS_THREADS = int(os.environ.get("MARKETPLACESVM_PUSH_PROCESS_THREADS", "10"))
     _SKIPPED = False
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the MarketplacesVMPush instance."""
+        # Limit the image uploads running at once across all the items and their marketplaces
+        self._upload_slots = threading.BoundedSemaphore(self._REQUEST_THREADS)
+        super(MarketplacesVMPush, self).__init__(*args, **kwargs)
+
     @property
     def raw_items(self) -> Iterator[VMIPushItem]:
         """
@@ -56,45 +70,57 @@ class MarketplacesVMPush(MarketplacesVMTask, CloudService, CollectorService, Sta
                     yield item
 
     @property
-    def mapped_items(self) -> List[Dict[str, Union[MappedVMIPushItemV2, QueryResponseEntity]]]:
+    def mapped_items(self) -> List[MappedEntry]:
         """
         Return the mapped push item with destinations and metadata from StArMap.
 
         Returns
             The wrapped push item with the additional information from StArMap.
         """
+        with Executors.thread_pool(
+            name="pubtools-marketplacesvm-starmap-query",
+            max_workers=self._REQUEST_THREADS,
+        ) as executor:
+            # Query StArMap as soon as each item is loaded from the sources while the
+            # responses are still processed in the items order.
+            queries = []
+            for item in self.raw_items:
+                binfo = item.build_info
+                if item.marketplace_name:
+                    name = binfo.name + "-" + item.marketplace_name
+                else:
+                    name = binfo.name
+                f_query = executor.submit(
+                    self.query_image_by_name, name=name, version=binfo.version
+                )
+                queries.append((item, f_query))
+
         mapped_items = []
-        for item in self.raw_items:
+        for item, f_query in queries:
             log.info("Retrieving the mappings for %s from %s", item.name, self.args.starmap_url)
             binfo = item.build_info
-            if item.marketplace_name:
-                name = binfo.name + "-" + item.marketplace_name
-            else:
-                name = binfo.name
             cloud = CLOUD_NAME_FOR_PI[type(item)]
-            query = self.query_image_by_name(
-                name=name,
-                version=binfo.version,
-            )
+            query = f_query.result()
             query = self.filter_for(query, workflow=Workflow.stratosphere, cloud=cloud)
             if query:
                 query_returned_from_starmap = query[0]
-                log.info(
-                    "starmap query returned for %s : %s",
-                    item.name,
-                    json.dumps(
-                        {
-                            "name": binfo.name,
-                            "version": binfo.version,
-                            "query_response": asdict(query_returned_from_starmap),
-                        }
-                    ),
-                )
+                if log.isEnabledFor(logging.INFO):
+                    log.info(
+                        "starmap query returned for %s : %s",
+                        item.name,
+                        json.dumps(
+                            {
+                                "name": binfo.name,
+                                "version": binfo.version,
+                                "query_response": asdict(query_returned_from_starmap),
+                            }
+                        ),
+                    )
                 item = MappedVMIPushItemV2(item, query_returned_from_starmap)
                 if not item.destinations:
                     log.info("Filtering out archive with no destinations: %s", item.push_item.src)
                     continue
-                mapped_items.append({"item": item, "starmap_query": query_returned_from_starmap})
+                mapped_items.append(MappedEntry(item, query_returned_from_starmap))
             else:
                 self._SKIPPED = True
                 log.error(f"No marketplace mappings found for {binfo.name} on cloud {cloud}")
@@ -155,7 +181,8 @@ class MarketplacesVMPush(MarketplacesVMTask, CloudService, CollectorService, Sta
             last_destination = ""
             for dest in push_item.dest:
                 # We don't want to publish again the same offer when pre-push == False (go live)
-                curr_dest = dest.destination.split("/")[0]  # get just the offer name, if applicable
+                # get just the offer name, if applicable
+                curr_dest = dest.destination.partition("/")[0]
                 if not pre_push and curr_dest == last_destination:
                     log.info(
                         "Push already done for offer %s on %s.", curr_dest, marketplace.upper()
@@ -198,6 +225,10 @@ class MarketplacesVMPush(MarketplacesVMTask, CloudService, CollectorService, Sta
         self, mapped_item: MappedVMIPushItemV2, starmap_query: QueryResponseEntity
     ) -> UPLOAD_RESULT:
         """Upload the mapped item to the storage accounts for all its marketplaces."""
+
+        # The mapped item is not thread-safe, thus everything needed for the uploads is resolved
+        # here and only the uploads themselves may run in parallel.
+        uploads = []
         for marketplace in mapped_item.marketplaces:
             # Upload the VM image to the marketplace
             # In order to get the correct destinations we need to first pass the result of
@@ -210,15 +241,32 @@ class MarketplacesVMPush(MarketplacesVMTask, CloudService, CollectorService, Sta
             meta = {}
             for d in pi.dest:
                 meta.update(mapped_item.get_metadata_for_mapped_item(d) or {})
-            pi = self._upload(
-                marketplace,
-                pi,
-                custom_tags=mapped_item.get_tags_for_marketplace(marketplace),
-                accounts=meta.get("sharing_accounts", []),
-                ami_version_template=mapped_item.get_ami_version_template_for_mapped_item(
+            upload_kwargs = {
+                "custom_tags": mapped_item.get_tags_for_marketplace(marketplace),
+                "accounts": meta.get("sharing_accounts", []),
+                "ami_version_template": mapped_item.get_ami_version_template_for_mapped_item(
                     marketplace
                 ),
-            )
+            }
+            uploads.append((marketplace, pi, upload_kwargs))
+
+        def upload_function(marketplace: str, pi: VMIPushItem, kwargs: Dict[str, Any]):
+            with self._upload_slots:
+                return self._upload(marketplace, pi, **kwargs)
+
+        if len(uploads) <= 1:  # No need to spawn threads for a single marketplace
+            uploaded = [upload_function(*upload) for upload in uploads]
+        else:
+            # The uploads for each marketplace go to different accounts, thus they can run
+            # in parallel, within the limit shared with the other items being uploaded
+            with Executors.thread_pool(
+                name="pubtools-marketplacesvm-push-marketplaces",
+                max_workers=min(len(uploads), self._REQUEST_THREADS),
+            ) as executor:
+                to_await = [executor.submit(upload_function, *upload) for upload in uploads]
+                uploaded = [f_out.result() for f_out in to_await]
+
+        for (marketplace, _, _), pi in zip(uploads, uploaded):
             mapped_item.update_push_item_for_marketplace(marketplace, pi)
         return mapped_item, starmap_query
 
@@ -352,19 +400,21 @@ class MarketplacesVMPush(MarketplacesVMTask, CloudService, CollectorService, Sta
 
         push_items = []
         mod_result = []
+        # The same StArMap query is shared by all marketplaces of an item, so only convert it once
+        query_dicts: Dict[int, Dict[str, Any]] = {}
         for result in results:
-            res_dict = asdict(result["push_item"])
-            if result.get("starmap_query"):
-                res_dict["starmap_query"] = asdict(result["starmap_query"])
+            push_item = result["push_item"]
+            res_dict = {k: v for k, v in asdict(push_item).items() if v is not None}
+            starmap_query = result.get("starmap_query")
+            if starmap_query:
+                query_key = id(starmap_query)
+                if query_key not in query_dicts:
+                    query_dicts[query_key] = asdict(starmap_query)
+                res_dict["starmap_query"] = query_dicts[query_key]
             if result.get("cloud_info"):
                 res_dict["cloud_info"] = result["cloud_info"]
-            # dict can't be modified during iteration.
-            # so iterate over list of keys.
-            for key in list(res_dict):
-                if res_dict[key] is None:
-                    del res_dict[key]
             mod_result.append(res_dict)
-            push_items.append(result["push_item"])
+            push_items.append(push_item)
 
         metadata = json.dumps(mod_result, default=convert, indent=2, sort_keys=True)
         self.collector.update_push_items(push_items).result()
@@ -412,16 +462,13 @@ class MarketplacesVMPush(MarketplacesVMTask, CloudService, CollectorService, Sta
             max_workers=min(max(len(mapped_items), 1), self._REQUEST_THREADS),
         )
 
-        to_upload = []
-        upload_result = []
-        for item in mapped_items:
-            to_upload.append(
-                executor.submit(self._push_upload, item["item"], item["starmap_query"])
-            )
+        to_upload = [
+            executor.submit(self._push_upload, entry.item, entry.starmap_query)
+            for entry in mapped_items
+        ]
 
         # waiting for upload results
-        for f_out in to_upload:
-            upload_result.append(f_out.result())
+        upload_result = [f_out.result() for f_out in to_upload]
 
         # 3 - Execute any pre-publishing routine
         upload_result = self._push_pre_publish(upload_result)
@@ -1,13 +1,30 @@
 import logging
-from typing import Any, Callable, ClassVar, Dict, List
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, List, NamedTuple, Optional, Tuple, Type
 
-from attrs import Factory, asdict, define, evolve, field
+from attrs import Factory, asdict, define, evolve, field, fields
 from attrs.validators import deep_mapping, instance_of
 from pushsource import AmiPushItem, AmiRelease, VMIPushItem, VMIRelease
 from starmap_client.models import Destination, QueryResponseEntity
 
 log = logging.getLogger("pubtools.marketplacesvm")
 
+IGNORE_UNSET_ATTRIBUTES = frozenset(("md5sum", "sha256sum", "signing_key", "origin"))
+
+
+@lru_cache(maxsize=None)
+def _attribute_names(klass: Type[VMIPushItem]) -> Tuple[str, ...]:
+    return tuple(attribute.name for attribute in fields(klass))
+
+
+class _DestinationsCache(NamedTuple):
+    """The destinations computed for a query entity and architecture."""
+
+    query_entity: QueryResponseEntity
+    arch: str
+    destinations: List[Destination]
+    by_id: Dict[int, Destination]
+
 
 @define
 class MappedVMIPushItemV2:
@@ -32,24 +49,54 @@ class MappedVMIPushItemV2:
     )
     """The underlying pushsource.VMIPushItem for each marketplace."""
 
+    _destinations_cache: Optional[_DestinationsCache] = field(
+        init=False, default=None, eq=False, repr=False
+    )
+    """Cached destinations and their identity index for the current entity and arch."""
+
+    _properties_mapped: bool = field(init=False, default=False, eq=False, repr=False)
+    """Whether the StArMap metadata from a non-empty mapping was applied to the push item."""
+
     @property
     def marketplaces(self) -> List[str]:
         """Return a list of marketplaces accounts for the stored PushItem."""
         return self.starmap_query_entity.account_names
 
+    def _get_destinations_cache(self) -> _DestinationsCache:
+        """Return the destinations for the current query entity and push item architecture."""
+        query_entity = self.starmap_query_entity
+        arch = self.push_item.release.arch
+        cache = self._destinations_cache
+        if cache is not None and cache.query_entity is query_entity and cache.arch == arch:
+            return cache
+
+        mappings = query_entity.mappings
+        dest = [
+            dst
+            for mkt in query_entity.account_names
+            for dst in mappings[mkt].destinations
+            if not dst.architecture or dst.architecture == arch
+        ]
+        cache = _DestinationsCache(query_entity, arch, dest, {id(dst): dst for dst in dest})
+        self._destinations_cache = cache
+        return cache
+
     @property
     def destinations(self) -> List[Destination]:
         """Return a list with all destinations associated with the stored push item."""
-        dest = []
-        for mkt in self.marketplaces:
-            dest.extend(
-                [
-                    dst
-                    for dst in self.starmap_query_entity.mappings[mkt].destinations
-                    if not dst.architecture or dst.architecture == self.push_item.release.arch
-                ]
-            )
-        return dest
+        return self._get_destinations_cache().destinations
+
+    def _find_destination(self, destination: Destination) -> Optional[Destination]:
+        """Return the stored destination equal to the given one, if any."""
+        cache = self._get_destinations_cache()
+        # The destinations given are usually the very same objects stored here
+        dst = cache.by_id.get(id(destination))
+        if dst is not None:
+            return dst
+        for dst in cache.destinations:
+            if dst == destination:
+                return dst
+        return None
 
     @property
     def tags(self) -> Dict[str, Any]:
@@ -91,19 +138,19 @@ class MappedVMIPushItemV2:
             pi = evolve(pi, release=rel_obj)
 
         # Update the push item attributes for each type using the attrs hidden annotation
-        ignore_unset_attributes = ["md5sum", "sha256sum", "signing_key", "origin"]
+        converters = self._CONVERTER_HANDLERS
         new_attrs = {}
-        for attribute in pi.__attrs_attrs__:
-            if not getattr(pi, attribute.name, None):  # If attribute is not set
-                value = meta.get(attribute.name, None)  # Get the value from "dst.meta"
+        for name in _attribute_names(type(pi)):
+            if not getattr(pi, name, None):  # If attribute is not set
+                value = meta.get(name)  # Get the value from "dst.meta"
                 if value:  # If the value is set in the metadata
-                    func = self._CONVERTER_HANDLERS.get(attribute.name, lambda x: x)  # Converter
-                    new_attrs.update({attribute.name: func(value)})  # Set the new value
-                elif attribute.name not in ignore_unset_attributes:
+                    func = converters.get(name)  # Converter
+                    new_attrs[name] = func(value) if func else value  # Set the new value
+                elif name not in IGNORE_UNSET_ATTRIBUTES:
                     log.warning(
                         "Missing information for the attribute %s.%s, leaving it unset.",
                         pi.name,
-                        attribute.name,
+                        name,
                     )
 
         # Finally return the updated push_item
@@ -111,7 +158,7 @@ class MappedVMIPushItemV2:
 
     def _map_push_item(self, destinations: List[Destination]) -> VMIPushItem:
         """Return the wrapped push item with the missing attributes set."""
-        if (
+        if self._properties_mapped or (
             self.push_item.dest and "starmap" not in self.push_item.dest
         ):  # If it has destinations it means we already mapped its properties
             # Just update the destinations for the marketplace and return
@@ -120,6 +167,8 @@ class MappedVMIPushItemV2:
 
         # Update the missing fields for push item and its release
         self.push_item = self._update_push_item_properties(self.push_item, destinations)
+        # A marketplace without destinations has no metadata to apply, so let the next one map it
+        self._properties_mapped = bool(destinations)
         return self.push_item
 
     @classmethod
@@ -145,7 +194,7 @@ class MappedVMIPushItemV2:
         Returns:
             The VMIPushItem with the destinations for the given marketplace account.
         """
-        if account not in self.marketplaces:
+        if account not in self.starmap_query_entity.mappings:
             raise ValueError(f"No such marketplace {account}")
 
         if not self._mapped_push_item.get(account):
@@ -182,10 +231,8 @@ class MappedVMIPushItemV2:
         Returns:
             The related metadata for the given destination.
         """
-        for dst in self.destinations:
-            if dst == destination:
-                return dst.meta
-        return {}
+        dst = self._find_destination(destination)
+        return dst.meta if dst is not None else {}
 
     def get_tags_for_mapped_item(self, destination: Destination) -> Dict[str, str]:
         """Return all custom tags related to a push item containing a single destination.
@@ -196,10 +243,8 @@ class MappedVMIPushItemV2:
         Returns:
             The related custom tags for the given destination.
         """
-        for dst in self.destinations:
-            if dst == destination:
-                return dst.tags
-        return {}
+        dst = self._find_destination(destination)
+        return dst.tags if dst is not None else {}
 
     def get_ami_version_template_for_mapped_item(self, destination: Destination) -> str:
         """Return the ami version template for a single destination.
@@ -210,10 +255,8 @@ class MappedVMIPushItemV2:
         Returns:
             The AMI version template associated with this destination.
         """
-        for dst in self.destinations:
-            if dst == destination:
-                return dst.ami_version_template
-        return ""
+        dst = self._find_destination(destination)
+        return dst.ami_version_template if dst is not None else ""
 
     def get_tags_for_marketplace(self, account: str) -> Dict[str, str]:
         """Return all custom tags for the destinations of a given marketplace account.
@@ -224,7 +267,7 @@ class MappedVMIPushItemV2:
         Returns:
             Dict[str, str]: The custom tags for the destinations of the given marketplace account.
         """
-        if account not in self.marketplaces:
+        if account not in self.starmap_query_entity.mappings:
             raise ValueError(f"No such marketplace {account}")
 
         res = {}
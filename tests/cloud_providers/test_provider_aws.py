@@ -187,6 +187,44 @@ def test_get_provider(
     assert isinstance(provider, AWSProvider)
 
 
+def test_credentials_dict(fake_credentials: AWSCredentials) -> None:
+    assert fake_credentials.credentials == {
+        "AWS_IMAGE_ACCESS_KEY": "fake-access-key",
+        "AWS_IMAGE_SECRET_ACCESS": "fake-secrets",
+        "AWS_MARKETPLACE_ACCESS_KEY": "fake-access-key",
+        "AWS_MARKETPLACE_SECRET_ACCESS": "fake-secrets",
+        "AWS_ACCESS_ROLE_ARN": "secret-role",
+        "AWS_GROUPS": ["2134", "124523"],
+        "AWS_ACCOUNTS": ["23232", "24124142"],
+        "AWS_SNAPSHOT_ACCOUNTS": ["23532", "32532234"],
+        "AWS_REGION": "us-east-1",
+        "AWS_S3_BUCKET": UPLOAD_CONTAINER_NAME,
+    }
+
+
+def test_credentials_equality(fake_credentials: AWSCredentials) -> None:
+    creds = fake_credentials.credentials
+    same = AWSCredentials(cloud_name="test-na", **creds)  # type: ignore
+    assert same == fake_credentials
+    assert hash(same) == hash(fake_credentials)
+
+    creds.update({"AWS_IMAGE_ACCESS_KEY": "another-access-key"})
+    other = AWSCredentials(cloud_name="test-na", **creds)  # type: ignore
+    assert other != fake_credentials
+
+
+@pytest.mark.parametrize("key", ["AWS_GROUPS", "AWS_ACCOUNTS"])
+@pytest.mark.parametrize("value", ["23232", ["23232", 24124142], None])
+def test_credentials_invalid_accounts(
+    key: str, value: Any, fake_credentials: AWSCredentials
+) -> None:
+    creds = fake_credentials.credentials
+    creds[key] = value
+
+    with pytest.raises(TypeError, match="Expected a list of strings"):
+        AWSCredentials(cloud_name="test-na", **creds)  # type: ignore
+
+
 def test_name_from_push_item(aws_push_item: AmiPushItem, fake_aws_provider: AWSProvider):
     expected_name = "base_product-1.1-sample_product-1.0_VIRT_GA-20230130-x86_64-0"
     res = name_from_push_item(aws_push_item)
@@ -5,7 +5,9 @@ import pytest
 from _pytest.logging import LogCaptureFixture
 from pushsource import PushItem
 
+from pubtools._marketplacesvm import cloud_providers
 from pubtools._marketplacesvm.cloud_providers import CloudCredentials, CloudProvider, get_provider
+from pubtools._marketplacesvm.cloud_providers.base import register_provider
 
 from .conftest import FakeProvider
 
@@ -24,6 +26,24 @@ def test_get_provider_notfound(caplog: LogCaptureFixture) -> None:
             get_provider({"marketplace_account": "cloud-emea", "auth": {"auth": "data"}})
 
 
+def test_register_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Register the provider into a copy of the providers mapping to not affect other tests
+    providers = dict(getattr(cloud_providers.base, "__CLOUD_PROVIDERS"))
+    monkeypatch.setattr(cloud_providers.base, "__CLOUD_PROVIDERS", providers)
+
+    register_provider(FakeProvider, "fake-na", "fake-emea")
+
+    for account in ["fake-na", "fake-emea"]:
+        provider = get_provider({"marketplace_account": account, "auth": {"auth": "data"}})
+        assert isinstance(provider, FakeProvider)
+
+
+def test_unknown_lazy_attribute() -> None:
+    expected_err = "module 'pubtools._marketplacesvm.cloud_providers' has no attribute 'Foo'"
+    with pytest.raises(AttributeError, match=expected_err):
+        cloud_providers.Foo
+
+
 class TestCloudCredentials:
     def test_invalid_credentials(self) -> None:
         """Ensure the `cloud_name` must contain the prefix `-na` or `-emea`."""
@@ -27,6 +27,8 @@ def combined_vm_push(monkeysession: pytest.MonkeyPatch) -> None:
     monkeysession.setattr(MarketplacesVMPush, '_PROCESS_THREADS', 1)
     monkeysession.setattr(CommunityVMPush, '_REQUEST_THREADS', 1)
     monkeysession.setattr(CommunityVMPush, '_PROCESS_THREADS', 1)
+    monkeysession.setattr(CommunityVMPush, '_QUERY_THREADS', 1)
+    monkeysession.setattr(CommunityVMPush, '_SOURCE_THREADS', 1)
 
     monkeysession.setattr(CombinedVMPush, '_REQUEST_THREADS', 1)
 
@@ -24,6 +24,8 @@ def community_vm_push(monkeysession: pytest.MonkeyPatch) -> None:
     """Set a single-thread for CommunityVMPush."""
     monkeysession.setattr(CommunityVMPush, '_REQUEST_THREADS', 1)
     monkeysession.setattr(CommunityVMPush, '_PROCESS_THREADS', 1)
+    monkeysession.setattr(CommunityVMPush, '_QUERY_THREADS', 1)
+    monkeysession.setattr(CommunityVMPush, '_SOURCE_THREADS', 1)
 
 
 @pytest.fixture
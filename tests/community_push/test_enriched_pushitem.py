@@ -5,24 +5,23 @@ from pushsource import AmiPushItem
 from starmap_client.models import BillingCodeRule, Destination
 
 from pubtools._marketplacesvm.tasks.community_push.items import (
-    _fix_arm64_arch,
-    _get_push_item_public_image,
-    _set_push_item_billing_code,
+    _get_arch,
+    _get_billing_codes,
+    _is_public_image,
 )
 
 
 @pytest.mark.parametrize("product", ["RHEL_HA", "SAP"])
-def test_get_push_item_public_image(product: str, ami_push_item: AmiPushItem) -> None:
+def test_is_public_image(product: str, ami_push_item: AmiPushItem) -> None:
     release = ami_push_item.release
     release = evolve(release, product=product, type="beta")
-    pi = evolve(ami_push_item, release=release)
 
-    res = _get_push_item_public_image(pi)
+    res = _is_public_image("hourly", release)
 
-    assert res.public_image is False
+    assert res is False
 
 
-def test_set_push_item_billing_code_no_name(ami_push_item: AmiPushItem) -> None:
+def test_get_billing_codes_no_name(ami_push_item: AmiPushItem) -> None:
     bcode = {
         "sample-hourly": BillingCodeRule.from_json(
             {
@@ -42,17 +41,15 @@ def test_set_push_item_billing_code_no_name(ami_push_item: AmiPushItem) -> None:
         }
     )
 
-    res = _set_push_item_billing_code(ami_push_item, dst, bcode)
+    res_bcode = _get_billing_codes(ami_push_item, dst, bcode)
 
-    res_bcode = res.billing_codes
     assert res_bcode.name == "Hourly2"
 
 
 def test_rename_aarch64_to_arm64(ami_push_item: AmiPushItem) -> None:
     release = ami_push_item.release
     release = evolve(release, arch="aarch64")
-    ami_push_item = evolve(ami_push_item, release=release)
 
-    pi = _fix_arm64_arch(ami_push_item)
+    arch = _get_arch(release)
 
-    assert pi.release.arch == "arm64"
+    assert arch == "arm64"
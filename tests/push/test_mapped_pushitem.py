@@ -69,6 +69,63 @@ def test_mapped_item_properties(
             mapped_item.get_tags_for_marketplace("foo")
 
 
+def test_mapped_item_destinations_follow_push_item_arch(
+    ami_push_item: AmiPushItem, starmap_query_aws: QueryResponseEntity
+) -> None:
+    """Ensure the cached destinations are refreshed when the push item architecture changes."""
+    mapped_item = MappedVMIPushItemV2(ami_push_item, starmap_query_aws)
+    all_destinations = []
+    for _, mrobj in starmap_query_aws.mappings.items():
+        all_destinations.extend(mrobj.destinations)
+    assert mapped_item.destinations == all_destinations
+    assert mapped_item.destinations is mapped_item.destinations
+
+    release = evolve(ami_push_item.release, arch="aarch64")
+    mapped_item.push_item = evolve(ami_push_item, release=release)
+
+    assert mapped_item.destinations == [
+        d for d in all_destinations if not d.architecture or d.architecture == "aarch64"
+    ]
+
+
+def test_mapped_item_properties_from_first_non_empty_mapping(
+    ami_push_item: AmiPushItem, starmap_response_aws: Dict[str, Any]
+) -> None:
+    """Ensure a marketplace without destinations doesn't prevent the metadata mapping."""
+    # The first marketplace has no destinations, thus it has no metadata to apply
+    starmap_response_aws["mappings"]["aws-na"]["destinations"] = []
+    emea_meta = starmap_response_aws["mappings"]["aws-emea"]["destinations"][0]["meta"]
+    emea_meta.update({"description": "emea-description", "volume": "gp3"})
+    # A later marketplace must not apply its metadata again
+    starmap_response_aws["mappings"]["aws-us-storage"] = {
+        "destinations": [
+            {
+                "architecture": "x86_64",
+                "destination": "11111111-1111-1111-1111-111111111111",
+                "overwrite": True,
+                "restrict_version": False,
+                "meta": {"description": "storage-description", "volume": "standard"},
+            }
+        ]
+    }
+    query = QueryResponseEntity.from_json(starmap_response_aws)
+    mapped_item = MappedVMIPushItemV2(ami_push_item, query)
+
+    pi = mapped_item.get_push_item_for_marketplace("aws-na")
+    assert pi.dest == []
+    assert not pi.description
+
+    pi = mapped_item.get_push_item_for_marketplace("aws-emea")
+    assert pi.dest == query.mappings["aws-emea"].destinations
+    assert pi.description == "emea-description"
+    assert pi.volume == "gp3"
+
+    pi = mapped_item.get_push_item_for_marketplace("aws-us-storage")
+    assert pi.dest == query.mappings["aws-us-storage"].destinations
+    assert pi.description == "emea-description"
+    assert pi.volume == "gp3"
+
+
 def test_mapped_item_fills_missing_attributes(
     ami_push_item: AmiPushItem, starmap_response_aws: Dict[str, Any]
 ) -> None:
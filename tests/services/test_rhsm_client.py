@@ -4,6 +4,7 @@
 #
 import logging
 
+import requests
 from _pytest.logging import LogCaptureFixture
 from mock import patch
 from requests.exceptions import ConnectionError
@@ -53,6 +54,24 @@ def test_create_region(requests_mocker) -> None:
     assert m_create_region.call_count == 2
 
 
+def test_send_merges_environment_once(requests_mocker) -> None:
+    """Ensure the environment settings are merged once per URL origin."""
+    url = "https://example.com/v1/internal/cloud_access_providers/amazon/regions"
+    requests_mocker.register_uri("POST", url)
+    client = AwsRHSMClient("https://example.com")
+
+    with patch.object(
+        client._session,
+        "merge_environment_settings",
+        wraps=client._session.merge_environment_settings,
+    ) as m_merge:
+        for _ in range(3):
+            req = requests.Request("POST", url, json={}).prepare()
+            assert client._send(req).ok
+
+    m_merge.assert_called_once()
+
+
 def test_update_image(requests_mocker, caplog: LogCaptureFixture) -> None:
     """Check the api that updates the AMI metadata present on RHSM for a specifc AMI ID."""
     url = "https://example.com/v1/internal/cloud_access_providers/amazon/amis"
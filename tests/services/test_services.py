@@ -3,6 +3,7 @@ import base64
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import py
@@ -42,6 +43,10 @@ def test_starmap_service() -> None:
         assert isinstance(client, StarmapClient)
         # Single StarmapClient instance per thread
         assert instance.starmap == client
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_client = executor.submit(lambda: instance.starmap).result()
+        assert isinstance(other_client, StarmapClient)
+        assert other_client is not client
 
 
 @patch("pubtools._marketplacesvm.services.starmap.StarmapClient")
@@ -72,6 +77,27 @@ def test_starmap_query(mock_client: MagicMock) -> None:
     assert res == qrc.responses
 
 
+@patch("pubtools._marketplacesvm.services.starmap.StarmapClient")
+def test_starmap_query_concurrent(mock_client: MagicMock) -> None:
+    """Ensure concurrent queries for the same name only request it once from the server."""
+    data = load_json("tests/data/starmap/container.json")
+    qrc = QueryResponseContainer.from_json(data)
+    mock_client.return_value.query_image_by_name.return_value = qrc
+    arg = ["", "-d", "fakesource"]
+    instance = MarketplacesVMPush()
+
+    with patch.object(sys, "argv", arg):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda _: instance.query_image_by_name("product-test"), range(4))
+            )
+
+    mock_client.return_value.query_image_by_name.assert_called_once_with(
+        name="product-test", version=None
+    )
+    assert all(res == qrc.responses for res in results)
+
+
 @patch("pubtools._marketplacesvm.services.starmap.StarmapClient")
 def test_starmap_filter_workflow(mock_client: MagicMock) -> None:
     """Ensure the `StarmapService.filter_by_workflow` are properly working."""
@@ -197,3 +223,21 @@ def test_azure_provider_service(
     mock_us.from_connection_string.assert_called()
     mock_pm.assert_not_called()
     mock_um.assert_not_called()
+
+
+def test_cloud_credentials_loaded_once(tmpdir: py.path.local) -> None:
+    """Ensure the credentials are only parsed once per CloudService."""
+    fake_auth = {"marketplace_account": "aws-na", "auth": {}}
+    creds_file = tmpdir.join("auth.json")
+    with open(creds_file, 'w') as f:
+        f.write(json.dumps(fake_auth))
+
+    instance = MarketplacesVMPush()
+    arg = ["", "--credentials", str(creds_file), "-d", "-d", "fakesource"]
+    with patch.object(sys, "argv", arg):
+        with patch("json.loads", side_effect=json.loads) as mock_loads:
+            assert instance._get_cloud_credentials("aws-na") == fake_auth
+            assert instance._get_cloud_credentials("aws-na") == fake_auth
+            with pytest.raises(ValueError, match="The credentials for aws-emea were not found."):
+                instance._get_cloud_credentials("aws-emea")
+    mock_loads.assert_called_once()